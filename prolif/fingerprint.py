@@ -25,8 +25,10 @@ Calculate a Protein-Ligand Interaction Fingerprint --- :mod:`prolif.fingerprint`
 
 """
 
+import copy
 import os
 import warnings
+import weakref
 from collections.abc import Sized
 from functools import wraps
 from typing import Literal, Optional, Tuple
@@ -35,6 +37,7 @@ import dill
 import multiprocess as mp
 import numpy as np
 from rdkit import Chem
+from scipy.spatial import cKDTree
 from tqdm.auto import tqdm
 
 from prolif.ifp import IFP
@@ -42,10 +45,12 @@ from prolif.interactions.base import _BASE_INTERACTIONS, _INTERACTIONS
 from prolif.molecule import Molecule
 from prolif.parallel import MolIterablePool, TrajectoryPool
 from prolif.plotting.utils import IS_NOTEBOOK
+from prolif.residue import ResidueId
 from prolif.utils import (
+    _ifp_to_matrix,
+    _matrix_to_bitvectors,
+    _matrix_to_countvectors,
     get_residues_near_ligand,
-    to_bitvectors,
-    to_countvectors,
     to_dataframe,
 )
 
@@ -220,6 +225,9 @@ class Fingerprint:
             setattr(self, name.lower(), interaction)
             if name in interactions:
                 self.interactions[name] = wrapper(interaction)
+        # bound once so that the hot loop in `bitvector` doesn't go through
+        # dict and attribute lookups for every residue pair
+        self._interaction_calls = tuple(self.interactions.values())
 
     def _check_valid_interactions(self, interactions_iterable, varname):
         """Raises a NameError if an unknown interaction is given."""
@@ -235,6 +243,15 @@ class Fingerprint:
         params = f"{self.n_interactions} interactions: {list(self.interactions.keys())}"
         return f"<{name}: {params} at {id(self):#x}>"
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the persistent pool holds live process handles and cannot be
+        # serialized, neither by `to_pickle` nor when sent to the workers
+        state.pop("_pool", None)
+        state.pop("_pool_key", None)
+        state.pop("_pool_finalizer", None)
+        return state
+
     @staticmethod
     def list_available(show_hidden=False):
         """List interactions available to the Fingerprint class.
@@ -271,12 +288,18 @@ class Fingerprint:
             An array storing the encoded interactions between res1 and res2. Depending
             on :attr:`Fingerprint.count`, the dtype of the array will be bool or uint8.
         """
-        bitvector = [
-            interaction(res1, res2) for interaction in self.interactions.values()
-        ]
+        calls = self._interaction_calls
         if self.count:
-            return np.array([sum(bits) for bits in bitvector], dtype=np.uint8)
-        return np.array(bitvector, dtype=bool)
+            return np.fromiter(
+                (len(interaction(res1, res2)) for interaction in calls),
+                dtype=np.uint8,
+                count=len(calls),
+            )
+        return np.fromiter(
+            (interaction(res1, res2) is not None for interaction in calls),
+            dtype=bool,
+            count=len(calls),
+        )
 
     def metadata(self, res1, res2):
         """Generates a metadata dictionary for the interactions between two residues.
@@ -361,11 +384,14 @@ class Fingerprint:
         """
         ifp = IFP()
         prot_residues = prot.residues if residues == "all" else residues
+        # the tree only depends on the protein so it is shared between ligand
+        # residues
+        prot_tree = cKDTree(prot.xyz) if residues is None else None
         get_interactions = self.metadata if metadata else self.bitvector
         for lresid, lres in lig.residues.items():
             if residues is None:
                 prot_residues = get_residues_near_ligand(
-                    lres, prot, self.vicinity_cutoff
+                    lres, prot, self.vicinity_cutoff, tree=prot_tree
                 )
             for prot_key in prot_residues:
                 pres = prot[prot_key]
@@ -467,7 +493,9 @@ class Fingerprint:
         if n_jobs is None:
             n_jobs = int(os.environ.get("PROLIF_N_JOBS", 0)) or None
         if residues == "all":
-            residues = list(Molecule.from_mda(prot, **converter_kwargs[1]).residues)
+            # the identifiers can be read directly from the MDAnalysis
+            # topology, no need to convert the whole protein to enumerate them
+            residues = [ResidueId.from_mda(residue) for residue in prot.residues]
         if n_jobs != 1:
             return self._run_parallel(
                 traj,
@@ -480,10 +508,17 @@ class Fingerprint:
             )
 
         iterator = tqdm(traj) if progress else traj
+        lig_mol = prot_mol = None
         ifp = {}
         for ts in iterator:
-            lig_mol = Molecule.from_mda(lig, **converter_kwargs[0])
-            prot_mol = Molecule.from_mda(prot, **converter_kwargs[1])
+            if lig_mol is None:
+                # convert the topology on the first frame only, then simply
+                # overwrite the coordinates for the following ones
+                lig_mol = Molecule.from_mda(lig, **converter_kwargs[0])
+                prot_mol = Molecule.from_mda(prot, **converter_kwargs[1])
+            else:
+                lig_mol._update_coordinates(lig.positions)
+                prot_mol._update_coordinates(prot.positions)
             ifp[int(ts.frame)] = self.generate(
                 lig_mol, prot_mol, residues=residues, metadata=True
             )
@@ -511,17 +546,63 @@ class Fingerprint:
         else:
             frames = range(n_frames)
         chunks = np.array_split(frames, n_chunks)
-        args_iterable = [(traj, lig, prot, chunk) for chunk in chunks]
         ifp = {}
 
-        with TrajectoryPool(
+        tqdm_kwargs = {"total": len(frames), "disable": not progress}
+        # the pool is kept alive between runs on the same system (common in
+        # notebooks) to amortize the worker startup and the serialization of
+        # the trajectory and atomgroups. The serialized fingerprint is part of
+        # the key: the workers only ever see the copy made when the pool was
+        # created, so any change to the fingerprint state (cutoffs, interaction
+        # parameters...) must trigger a rebuild to be taken into account. The
+        # results of a previous run are stripped from the payload: the workers
+        # don't need them, and keeping them would make every rerun look like a
+        # state change
+        fp_worker = copy.copy(self)
+        fp_worker.__dict__.pop("ifp", None)
+        fingerprint_pickle = dill.dumps(fp_worker, protocol=dill.HIGHEST_PROTOCOL)
+        pool_key = (
             n_jobs,
-            fingerprint=self,
-            residues=residues,
-            tqdm_kwargs={"total": len(frames), "disable": not progress},
-            rdkitconverter_kwargs=converter_kwargs,
-        ) as pool:
-            for ifp_data_chunk in pool.process(args_iterable):
+            id(traj),
+            id(lig),
+            id(prot),
+            residues,
+            converter_kwargs,
+            fingerprint_pickle,
+        )
+        pool = getattr(self, "_pool", None)
+        if pool is not None and self._pool_key == pool_key:
+            pool.tqdm_kwargs = tqdm_kwargs
+        else:
+            if pool is not None:
+                self._pool_finalizer.detach()
+                pool.close()
+            pool = TrajectoryPool(
+                n_jobs,
+                fingerprint_pickle=fingerprint_pickle,
+                traj=traj,
+                lig=lig,
+                prot=prot,
+                residues=residues,
+                tqdm_kwargs=tqdm_kwargs,
+                rdkitconverter_kwargs=converter_kwargs,
+            )
+            self._pool = pool
+            # dill warms up internal caches while serializing the dynamically
+            # generated interaction classes for the first time, which makes
+            # the first payload non-reproducible: serialize again so that the
+            # cached key compares equal on an identical rerun
+            self._pool_key = pool_key[:-1] + (
+                dill.dumps(fp_worker, protocol=dill.HIGHEST_PROTOCOL),
+            )
+            # ensures the workers are terminated cleanly once the fingerprint
+            # is garbage collected or the interpreter exits; the fingerprint
+            # stays collectable because the pool only holds a serialized copy
+            # of it in its init args
+            self._pool_finalizer = weakref.finalize(self, pool.close)
+
+        with pool:
+            for ifp_data_chunk in pool.process(chunks):
                 ifp.update(ifp_data_chunk)
 
         self.ifp = ifp
@@ -719,8 +800,10 @@ class Fingerprint:
 
         """
         if hasattr(self, "ifp"):
-            df = self.to_dataframe()
-            return to_bitvectors(df)
+            values, _ = _ifp_to_matrix(self.ifp, self.interactions, count=self.count)
+            # same columns as the default drop_empty=True dataframe
+            values = values[:, values.any(axis=0)]
+            return _matrix_to_bitvectors(values)
         raise AttributeError("Please use the `run` method before")
 
     def to_countvectors(self):
@@ -750,8 +833,10 @@ class Fingerprint:
         .. versionadded: 2.0.0
         """
         if hasattr(self, "ifp"):
-            df = self.to_dataframe()
-            return to_countvectors(df)
+            values, _ = _ifp_to_matrix(self.ifp, self.interactions, count=self.count)
+            # same columns as the default drop_empty=True dataframe
+            values = values[:, values.any(axis=0)]
+            return _matrix_to_countvectors(values)
         raise AttributeError("Please use the `run` method before")
 
     def to_pickle(self, path=None):
@@ -789,9 +874,9 @@ class Fingerprint:
         """
         if path:
             with open(path, "wb") as f:
-                dill.dump(self, f)
+                dill.dump(self, f, protocol=dill.HIGHEST_PROTOCOL)
             return None
-        return dill.dumps(self)
+        return dill.dumps(self, protocol=dill.HIGHEST_PROTOCOL)
 
     @classmethod
     def from_pickle(cls, path_or_bytes):
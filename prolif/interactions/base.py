@@ -12,8 +12,9 @@ from math import degrees, radians
 import numpy as np
 from rdkit import Geometry
 from rdkit.Chem import MolFromSmarts
+from scipy.spatial.distance import cdist
 
-from prolif.interactions.utils import DISTANCE_FUNCTIONS, get_mapindex
+from prolif.interactions.utils import DISTANCE_INDICES, get_parent_indices
 from prolif.utils import angle_between_limits, get_centroid, get_ring_normal_vector
 
 _INTERACTIONS = {}
@@ -56,8 +57,8 @@ class Interaction:
     def metadata(self, lig_res, prot_res, lig_indices, prot_indices, **data):
         """Returns a dict containing the indices of atoms responsible for the
         interaction, alongside any other metrics (e.g. distance, angle...etc.)."""
-        if hasattr(self, "_metadata_mapping"):
-            mapping = self._metadata_mapping or {}
+        mapping = getattr(self, "_metadata_mapping", None)
+        if mapping:
             data = {mapping.get(key, key): value for key, value in data.items()}
         return {
             "indices": {
@@ -65,12 +66,8 @@ class Interaction:
                 "protein": prot_indices,
             },
             "parent_indices": {
-                "ligand": tuple(
-                    [get_mapindex(lig_res, index) for index in lig_indices]
-                ),
-                "protein": tuple(
-                    [get_mapindex(prot_res, index) for index in prot_indices]
-                ),
+                "ligand": get_parent_indices(lig_res, lig_indices),
+                "protein": get_parent_indices(prot_res, prot_indices),
             },
             **data,
         }
@@ -131,17 +128,22 @@ class Distance(Interaction, is_abstract=True):
         self.distance = distance
 
     def detect(self, lig_res, prot_res):
-        lig_matches = lig_res.GetSubstructMatches(self.lig_pattern)
-        prot_matches = prot_res.GetSubstructMatches(self.prot_pattern)
+        lig_matches = lig_res.get_substruct_matches(self.lig_pattern)
+        prot_matches = prot_res.get_substruct_matches(self.prot_pattern)
         if lig_matches and prot_matches:
-            for lig_match, prot_match in product(lig_matches, prot_matches):
-                alig = Geometry.Point3D(*lig_res.xyz[lig_match[0]])
-                aprot = Geometry.Point3D(*prot_res.xyz[prot_match[0]])
-                dist = alig.Distance(aprot)
-                if dist <= self.distance:
-                    yield self.metadata(
-                        lig_res, prot_res, lig_match, prot_match, distance=dist
-                    )
+            # branchless cutoff test on all match pairs at once
+            distances = cdist(
+                lig_res.xyz[[match[0] for match in lig_matches]],
+                prot_res.xyz[[match[0] for match in prot_matches]],
+            )
+            for i, j in np.argwhere(distances <= self.distance):
+                yield self.metadata(
+                    lig_res,
+                    prot_res,
+                    lig_matches[i],
+                    prot_matches[j],
+                    distance=float(distances[i, j]),
+                )
 
 
 class SingleAngle(Interaction, is_abstract=True):
@@ -184,32 +186,39 @@ class SingleAngle(Interaction, is_abstract=True):
         self.prot_pattern = MolFromSmarts(prot_pattern)
         self.distance = distance
         self.angle = tuple(radians(i) for i in angle)
-        self._measure_distance = DISTANCE_FUNCTIONS[distance_atom]
+        self._distance_indices = DISTANCE_INDICES[distance_atom]
         self._metadata_mapping = metadata_mapping
 
     def detect(self, lig_res, prot_res):
-        lig_matches = lig_res.GetSubstructMatches(self.lig_pattern)
-        prot_matches = prot_res.GetSubstructMatches(self.prot_pattern)
+        lig_matches = lig_res.get_substruct_matches(self.lig_pattern)
+        prot_matches = prot_res.get_substruct_matches(self.prot_pattern)
         if lig_matches and prot_matches:
-            for lig_match, prot_match in product(lig_matches, prot_matches):
+            lig_index, prot_index = self._distance_indices
+            # vectorized distance prefilter: only compute angles for pairs
+            # within the distance threshold
+            distances = cdist(
+                lig_res.xyz[[match[lig_index] for match in lig_matches]],
+                prot_res.xyz[[match[prot_index] for match in prot_matches]],
+            )
+            for i, j in np.argwhere(distances <= self.distance):
+                lig_match = lig_matches[i]
+                prot_match = prot_matches[j]
                 l1 = Geometry.Point3D(*lig_res.xyz[lig_match[0]])
                 p1 = Geometry.Point3D(*prot_res.xyz[prot_match[0]])
                 p2 = Geometry.Point3D(*prot_res.xyz[prot_match[1]])
-                dist = self._measure_distance(l1, p1, p2)
-                if dist <= self.distance:
-                    # P1-P2 ... L1
-                    p2p1 = p2.DirectionVector(p1)
-                    p2l1 = p2.DirectionVector(l1)
-                    angle = p2p1.AngleTo(p2l1)
-                    if angle_between_limits(angle, *self.angle):
-                        yield self.metadata(
-                            lig_res,
-                            prot_res,
-                            lig_match,
-                            prot_match,
-                            distance=dist,
-                            angle=degrees(angle),
-                        )
+                # P1-P2 ... L1
+                p2p1 = p2.DirectionVector(p1)
+                p2l1 = p2.DirectionVector(l1)
+                angle = p2p1.AngleTo(p2l1)
+                if angle_between_limits(angle, *self.angle):
+                    yield self.metadata(
+                        lig_res,
+                        prot_res,
+                        lig_match,
+                        prot_match,
+                        distance=float(distances[i, j]),
+                        angle=degrees(angle),
+                    )
 
 
 class DoubleAngle(Interaction, is_abstract=True):
@@ -252,37 +261,44 @@ class DoubleAngle(Interaction, is_abstract=True):
         self.distance = distance
         self.L1P2P1_angle = tuple(radians(i) for i in L1P2P1_angle)
         self.L2L1P2_angle = tuple(radians(i) for i in L2L1P2_angle)
-        self._measure_distance = DISTANCE_FUNCTIONS[distance_atoms]
+        self._distance_indices = DISTANCE_INDICES[distance_atoms]
         self._metadata_mapping = metadata_mapping
 
     def detect(self, lig_res, prot_res):
-        lig_matches = lig_res.GetSubstructMatches(self.lig_pattern)
-        prot_matches = prot_res.GetSubstructMatches(self.prot_pattern)
+        lig_matches = lig_res.get_substruct_matches(self.lig_pattern)
+        prot_matches = prot_res.get_substruct_matches(self.prot_pattern)
         if lig_matches and prot_matches:
-            for lig_match, prot_match in product(lig_matches, prot_matches):
+            lig_index, prot_index = self._distance_indices
+            # vectorized distance prefilter: only compute angles for pairs
+            # within the distance threshold
+            distances = cdist(
+                lig_res.xyz[[match[lig_index] for match in lig_matches]],
+                prot_res.xyz[[match[prot_index] for match in prot_matches]],
+            )
+            for i, j in np.argwhere(distances <= self.distance):
+                lig_match = lig_matches[i]
+                prot_match = prot_matches[j]
                 l1 = Geometry.Point3D(*lig_res.xyz[lig_match[0]])
                 l2 = Geometry.Point3D(*lig_res.xyz[lig_match[1]])
                 p1 = Geometry.Point3D(*prot_res.xyz[prot_match[0]])
                 p2 = Geometry.Point3D(*prot_res.xyz[prot_match[1]])
-                dist = self._measure_distance(l1, l2, p1, p2)
-                if dist <= self.distance:
-                    p2p1 = p2.DirectionVector(p1)
-                    p2l1 = p2.DirectionVector(l1)
-                    l1p2p1 = p2p1.AngleTo(p2l1)
-                    if angle_between_limits(l1p2p1, *self.L1P2P1_angle):
-                        l1p2 = l1.DirectionVector(p2)
-                        l1l2 = l1.DirectionVector(l2)
-                        l2l1p2 = l1p2.AngleTo(l1l2)
-                        if angle_between_limits(l2l1p2, *self.L2L1P2_angle):
-                            yield self.metadata(
-                                lig_res,
-                                prot_res,
-                                lig_match,
-                                prot_match,
-                                distance=dist,
-                                L1P2P1_angle=degrees(l1p2p1),
-                                L2L1P2_angle=degrees(l2l1p2),
-                            )
+                p2p1 = p2.DirectionVector(p1)
+                p2l1 = p2.DirectionVector(l1)
+                l1p2p1 = p2p1.AngleTo(p2l1)
+                if angle_between_limits(l1p2p1, *self.L1P2P1_angle):
+                    l1p2 = l1.DirectionVector(p2)
+                    l1l2 = l1.DirectionVector(l2)
+                    l2l1p2 = l1p2.AngleTo(l1l2)
+                    if angle_between_limits(l2l1p2, *self.L2L1P2_angle):
+                        yield self.metadata(
+                            lig_res,
+                            prot_res,
+                            lig_match,
+                            prot_match,
+                            distance=float(distances[i, j]),
+                            L1P2P1_angle=degrees(l1p2p1),
+                            L2L1P2_angle=degrees(l2l1p2),
+                        )
 
 
 class BasePiStacking(Interaction, is_abstract=True):
@@ -341,8 +357,8 @@ class BasePiStacking(Interaction, is_abstract=True):
 
     def detect(self, ligand, residue):
         for pi_rings in product(self.pi_ring, repeat=2):
-            res_matches = residue.GetSubstructMatches(pi_rings[0])
-            lig_matches = ligand.GetSubstructMatches(pi_rings[1])
+            res_matches = residue.get_substruct_matches(pi_rings[0])
+            lig_matches = ligand.get_substruct_matches(pi_rings[1])
             if not (lig_matches and res_matches):
                 continue
             for lig_match, res_match in product(lig_matches, res_matches):
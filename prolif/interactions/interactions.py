@@ -13,9 +13,11 @@ Note that some of the SMARTS patterns used in the interaction classes are inspir
 from itertools import product
 from math import degrees, radians
 
+import numpy as np
 from MDAnalysis.topology.tables import vdwradii
 from rdkit import Geometry
 from rdkit.Chem import MolFromSmarts
+from scipy.spatial.distance import cdist
 
 from prolif.interactions.base import (
     BasePiStacking,
@@ -237,9 +239,9 @@ class CationPi(Interaction):
         self.angle = tuple(radians(i) for i in angle)
 
     def detect(self, cation, pi):
-        cation_matches = cation.GetSubstructMatches(self.cation)
+        cation_matches = cation.get_substruct_matches(self.cation)
         for pi_ring in self.pi_ring:
-            pi_matches = pi.GetSubstructMatches(pi_ring)
+            pi_matches = pi.get_substruct_matches(pi_ring)
             if not (cation_matches and pi_matches):
                 continue
             for cation_match, pi_match in product(cation_matches, pi_matches):
@@ -459,22 +461,35 @@ class VdWContact(Interaction):
         self._vdw_cache = {}
         self.vdwradii = {**VDWRADII, **vdwradii} if vdwradii else VDWRADII
 
+    def _get_threshold(self, lig, res):
+        elements = frozenset((lig, res))
+        try:
+            return self._vdw_cache[elements]
+        except KeyError:
+            vdw = self.vdwradii[lig] + self.vdwradii[res] + self.tolerance
+            self._vdw_cache[elements] = vdw
+            return vdw
+
     def detect(self, ligand, residue):
-        lxyz = ligand.GetConformer()
-        rxyz = residue.GetConformer()
-        for la, ra in product(ligand.GetAtoms(), residue.GetAtoms()):
-            lig = la.GetSymbol()
-            res = ra.GetSymbol()
-            elements = frozenset((lig, res))
-            try:
-                vdw = self._vdw_cache[elements]
-            except KeyError:
-                vdw = self.vdwradii[lig] + self.vdwradii[res] + self.tolerance
-                self._vdw_cache[elements] = vdw
-            dist = lxyz.GetAtomPosition(la.GetIdx()).Distance(
-                rxyz.GetAtomPosition(ra.GetIdx())
+        lig_symbols = [atom.GetSymbol() for atom in ligand.GetAtoms()]
+        res_symbols = [atom.GetSymbol() for atom in residue.GetAtoms()]
+        # the thresholds only depend on the elements involved, so they are
+        # computed for each unique pair of elements and broadcasted back to a
+        # matrix matching the distance matrix
+        lig_elements, lig_inverse = np.unique(lig_symbols, return_inverse=True)
+        res_elements, res_inverse = np.unique(res_symbols, return_inverse=True)
+        thresholds = np.array(
+            [
+                [self._get_threshold(lig, res) for res in res_elements]
+                for lig in lig_elements
+            ]
+        )[lig_inverse[:, None], res_inverse[None, :]]
+        distances = cdist(ligand.xyz, residue.xyz)
+        for i, j in np.argwhere(distances <= thresholds):
+            yield self.metadata(
+                ligand,
+                residue,
+                (int(i),),
+                (int(j),),
+                distance=float(distances[i, j]),
             )
-            if dist <= vdw:
-                yield self.metadata(
-                    ligand, residue, (la.GetIdx(),), (ra.GetIdx(),), distance=dist
-                )
@@ -24,35 +24,43 @@ def get_mapindex(res, index):
     return res.GetAtomWithIdx(index).GetUnsignedProp("mapindex")
 
 
-def _distance_3args_l1_p1(l1, p1, p2):
-    return l1.Distance(p1)
-
-
-def _distance_3args_l1_p2(l1, p1, p2):
-    return l1.Distance(p2)
-
-
-def _distance_4args_l1_p1(l1, l2, p1, p2):
-    return l1.Distance(p1)
-
-
-def _distance_4args_l1_p2(l1, l2, p1, p2):
-    return l1.Distance(p2)
-
-
-def _distance_4args_l2_p1(l1, l2, p1, p2):
-    return l2.Distance(p1)
-
-
-def _distance_4args_l2_p2(l1, l2, p1, p2):
-    return l2.Distance(p2)
+def get_parent_indices(res, indices):
+    """Get the indices of several residue atoms in the original molecule
 
+    Parameters
+    ----------
+    res : prolif.residue.Residue
+        The residue in the protein or ligand
+    indices : tuple
+        Indices of atoms in the :class:`~prolif.residue.Residue`
 
-DISTANCE_FUNCTIONS = {
-    "P1": _distance_3args_l1_p1,
-    "P2": _distance_3args_l1_p2,
-    ("L1", "P1"): _distance_4args_l1_p1,
-    ("L1", "P2"): _distance_4args_l1_p2,
-    ("L2", "P1"): _distance_4args_l2_p1,
-    ("L2", "P2"): _distance_4args_l2_p2,
+    Returns
+    -------
+    parent_indices : tuple
+        Indices of the atoms in the :class:`~prolif.molecule.Molecule`
+
+    Notes
+    -----
+    The full mapping is read from the atom properties once per residue and
+    cached, as fetching an RDKit atom and its property for every atom of every
+    interaction hit is a noticeable cost on long trajectories.
+    """
+    try:
+        mapindex = res._mapindex
+    except AttributeError:
+        mapindex = res._mapindex = tuple(
+            atom.GetUnsignedProp("mapindex") for atom in res.GetAtoms()
+        )
+    return tuple(mapindex[index] for index in indices)
+
+
+# position (in the SMARTS match) of the ligand and protein atoms used for the
+# distance calculation
+DISTANCE_INDICES = {
+    "P1": (0, 0),
+    "P2": (0, 1),
+    ("L1", "P1"): (0, 0),
+    ("L1", "P2"): (0, 1),
+    ("L2", "P1"): (1, 0),
+    ("L2", "P2"): (1, 1),
 }
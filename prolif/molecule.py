@@ -9,6 +9,7 @@ from collections.abc import Sequence
 from operator import attrgetter
 
 import MDAnalysis as mda
+import numpy as np
 from rdkit import Chem
 from rdkit.Chem.AllChem import AssignBondOrdersFromTemplate
 
@@ -81,6 +82,19 @@ class Molecule(BaseRDKitMol):
         residues = [Residue(mol) for mol in residues]
         residues.sort(key=attrgetter("resid"))
         self.residues = ResidueGroup(residues)
+        # map each atom to the position of its residue in the sorted group, and
+        # keep the parent indices of each residue's atoms for coordinate updates
+        atom_to_residue = np.empty(self.GetNumAtoms(), dtype=np.intp)
+        residue_indices = []
+        for position, residue in enumerate(self.residues.values()):
+            indices = np.array(
+                [atom.GetUnsignedProp("mapindex") for atom in residue.GetAtoms()],
+                dtype=np.intp,
+            )
+            atom_to_residue[indices] = position
+            residue_indices.append(indices)
+        self._atom_to_residue = atom_to_residue
+        self._residue_indices = residue_indices
 
     @classmethod
     def from_mda(cls, obj, selection=None, **kwargs):
@@ -159,6 +173,26 @@ class Molecule(BaseRDKitMol):
             atom.SetMonomerInfo(mi)
         return cls(mol)
 
+    def _update_coordinates(self, xyz):
+        """Overwrites the coordinates of the molecule and its residues in
+        place. The topology is left untouched, which allows reusing the same
+        Molecule (and its residue splitting and pattern-matching caches) for
+        every frame of a trajectory instead of rebuilding it from scratch.
+
+        Parameters
+        ----------
+        xyz : numpy.ndarray
+            XYZ coordinates of all atoms in the molecule, in the same order as
+            when the molecule was created
+        """
+        xyz = np.ascontiguousarray(xyz, dtype=np.float64)
+        self.GetConformer().SetPositions(xyz)
+        self._xyz = xyz
+        for residue, indices in zip(self.residues.values(), self._residue_indices):
+            residue_xyz = np.ascontiguousarray(xyz[indices])
+            residue.GetConformer().SetPositions(residue_xyz)
+            residue._xyz = residue_xyz
+
     def __iter__(self):
         for residue in self.residues.values():
             yield residue
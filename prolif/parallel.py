@@ -12,12 +12,14 @@ from ctypes import c_uint32
 from threading import Event, Thread
 from time import sleep
 
+import dill
 from multiprocess import Value
 from multiprocess.pool import Pool
 from tqdm.auto import tqdm
 
 from prolif.molecule import Molecule
 from prolif.pickling import PICKLE_HANDLER
+from prolif.utils import catch_warning
 
 
 class Progress:
@@ -83,8 +85,15 @@ class TrajectoryPool:
     ----------
     n_processes : int
         Max number of processes
-    fingerprint : prolif.fingerprint.Fingerprint
-        Fingerprint instance used to generate the IFP
+    fingerprint_pickle : bytes
+        Fingerprint instance used to generate the IFP, serialized with
+        :func:`dill.dumps`
+    traj : MDAnalysis.coordinates.base.ProtoReader
+        The trajectory to iterate over
+    lig : MDAnalysis.core.groups.AtomGroup
+        An MDAnalysis AtomGroup for the ligand
+    prot : MDAnalysis.core.groups.AtomGroup
+        An MDAnalysis AtomGroup for the protein
     residues : list, optional
         List of protein residues considered for the IFP
     tqdm_kwargs : dict
@@ -100,10 +109,27 @@ class TrajectoryPool:
         processed since the last progress bar update.
     pool : multiprocess.pool.Pool
         The underlying pool instance.
+
+    Notes
+    -----
+    The trajectory and atomgroups are serialized once per worker through the
+    pool initializer instead of once per task, so the tasks only carry the
+    array of frame indices to process. For the same reason, the pool can be
+    entered multiple times: :class:`~prolif.fingerprint.Fingerprint` keeps it
+    alive between :meth:`~prolif.fingerprint.Fingerprint.run` calls on the
+    same system so that repeated runs reuse the existing workers.
     """
 
     def __init__(
-        self, n_processes, fingerprint, residues, tqdm_kwargs, rdkitconverter_kwargs
+        self,
+        n_processes,
+        fingerprint_pickle,
+        traj,
+        lig,
+        prot,
+        residues,
+        tqdm_kwargs,
+        rdkitconverter_kwargs,
     ):
         self.tqdm_kwargs = tqdm_kwargs
         self.tracker = Value(c_uint32, lock=True)
@@ -112,23 +138,47 @@ class TrajectoryPool:
             initializer=self.initializer,
             initargs=(
                 self.tracker,
-                fingerprint,
+                # serialized upfront so that the init args, which stay alive
+                # in the worker handler thread for as long as the pool runs,
+                # don't hold a strong reference back to the fingerprint: this
+                # would prevent it from ever being garbage collected, and its
+                # finalizer from terminating the workers
+                fingerprint_pickle,
+                traj,
+                lig,
+                prot,
                 residues,
                 rdkitconverter_kwargs,
             ),
         )
 
     @classmethod
-    def initializer(cls, tracker, fingerprint, residues, rdkitconverter_kwargs):
+    def initializer(
+        cls,
+        tracker,
+        fingerprint_pickle,
+        traj,
+        lig,
+        prot,
+        residues,
+        rdkitconverter_kwargs,
+    ):
         """Initializer classmethod passed to the pool so that each child process can
         access these objects without copying them."""
         cls.tracker = tracker
-        cls.fp = fingerprint
+        # unpickling re-creates the dynamically generated interaction classes
+        # (e.g. the inverted-role ones), which harmlessly re-register
+        # themselves in each worker
+        with catch_warning(message=r".+ has been superseded"):
+            cls.fp = dill.loads(fingerprint_pickle)
+        cls.traj = traj
+        cls.lig = lig
+        cls.prot = prot
         cls.residues = residues
         cls.converter_kwargs = rdkitconverter_kwargs
 
     @classmethod
-    def executor(cls, args):
+    def executor(cls, chunk):
         """Classmethod executed by each child process on a chunk of the trajectory
 
         Returns
@@ -136,11 +186,17 @@ class TrajectoryPool:
         ifp_chunk: dict[int, prolif.ifp.IFP]
             A dictionary of :class:`~prolif.ifp.IFP` indexed by frame number
         """
-        traj, lig, prot, chunk = args
+        lig_mol = prot_mol = None
         ifp = {}
-        for ts in traj[chunk]:
-            lig_mol = Molecule.from_mda(lig, **cls.converter_kwargs[0])
-            prot_mol = Molecule.from_mda(prot, **cls.converter_kwargs[1])
+        for ts in cls.traj[chunk]:
+            if lig_mol is None:
+                # convert the topology on the first frame of the chunk only,
+                # then simply overwrite the coordinates for the following ones
+                lig_mol = Molecule.from_mda(cls.lig, **cls.converter_kwargs[0])
+                prot_mol = Molecule.from_mda(cls.prot, **cls.converter_kwargs[1])
+            else:
+                lig_mol._update_coordinates(cls.lig.positions)
+                prot_mol._update_coordinates(cls.prot.positions)
             data = cls.fp.generate(
                 lig_mol, prot_mol, residues=cls.residues, metadata=True
             )
@@ -149,14 +205,13 @@ class TrajectoryPool:
                 cls.tracker.value += 1
         return ifp
 
-    def process(self, args_iterable):
-        """Maps the input iterable of arguments to the executor function.
+    def process(self, chunks):
+        """Maps the input iterable of frame chunks to the executor function.
 
         Parameters
         ----------
-        args_iterable : typing.Iterable[tuple]
-            Iterable of tuple of trajectory, ligand atomgroup, protein atomgroup, and
-            array of frame indices.
+        chunks : typing.Iterable[numpy.ndarray]
+            Iterable of arrays of frame indices.
 
         Returns
         -------
@@ -164,7 +219,7 @@ class TrajectoryPool:
             An iterable of dictionaries of :class:`~prolif.ifp.IFP` indexed by frame
             number.
         """
-        return self.pool.map(self.executor, args_iterable, chunksize=1)
+        return self.pool.map(self.executor, chunks, chunksize=1)
 
     def __enter__(self):
         """Sets up the :class:`Progress` instance and associated killswitch event, and
@@ -180,6 +235,11 @@ class TrajectoryPool:
         self.killswitch.set()
         self.progress.close()
 
+    def close(self):
+        """Terminates the underlying pool and its worker processes."""
+        self.pool.terminate()
+        self.pool.join()
+
 
 class MolIterablePool:
     """Process pool for a parallelized IFP analysis on an iterable of ligands. Must be
@@ -70,16 +70,21 @@ class Barcode:
                 names=["protein", "interaction"],
             )
 
-        def _bit_to_color_value(s: pd.Series) -> pd.Series:
-            """Replaces a bit value with it's corresponding color value"""
-            interaction = s.name[-1]
-            return s.apply(
-                lambda v: (
-                    self.color_mapper[interaction] if v else self.color_mapper[None]
-                )
-            )
-
-        self.df = df.astype(np.uint8).T.apply(_bit_to_color_value, axis=1)
+        # replace bit values with the color value of the row's interaction in a
+        # single vectorized pass: one (interaction, residue) pair per row, one
+        # frame per column
+        values = df.to_numpy(dtype=np.uint8).T
+        color_values = np.array(
+            [
+                self.color_mapper[interaction]
+                for interaction in df.columns.get_level_values("interaction")
+            ]
+        )
+        self.df = pd.DataFrame(
+            np.where(values != 0, color_values[:, None], self.color_mapper[None]),
+            index=df.columns,
+            columns=df.index,
+        )
 
     @classmethod
     def from_fingerprint(cls, fp: Fingerprint) -> Barcode:
@@ -3,6 +3,7 @@ Reading RDKit molecules --- :mod:`prolif.rdkitmol`
 ==================================================
 """
 
+import numpy as np
 from rdkit import Chem
 from rdkit.Chem.rdMolTransforms import ComputeCentroid
 
@@ -33,4 +34,38 @@ class BaseRDKitMol(Chem.Mol):
 
     @property
     def xyz(self):
-        return self.GetConformer().GetPositions()
+        # the coordinates are extracted from the conformer only once instead
+        # of allocating a fresh copy on every detector call; any code mutating
+        # the conformer must refresh this cache, as
+        # `Molecule._update_coordinates` does when reusing a molecule across
+        # trajectory frames
+        try:
+            return self._xyz
+        except AttributeError:
+            self._xyz = np.ascontiguousarray(self.GetConformer().GetPositions())
+            return self._xyz
+
+    def get_substruct_matches(self, pattern):
+        """Same as :meth:`~rdkit.Chem.rdchem.Mol.GetSubstructMatches` but
+        caches the result for each query pattern.
+
+        The topology of the molecule never changes once created, while the
+        interaction classes match the same patterns against the same residues
+        over and over: within a frame, a residue is matched once for every
+        residue on the other side of the interaction, and with
+        :meth:`~prolif.fingerprint.Fingerprint.run_from_iterable` the protein
+        residues are rematched for every ligand.
+        """
+        try:
+            cache = self._substruct_matches
+        except AttributeError:
+            cache = self._substruct_matches = {}
+        key = id(pattern)
+        try:
+            return cache[key][1]
+        except KeyError:
+            matches = self.GetSubstructMatches(pattern)
+            # the pattern is stored alongside the matches to keep it alive,
+            # otherwise its id could be reused by another pattern object
+            cache[key] = (pattern, matches)
+            return matches
@@ -5,6 +5,7 @@ Residue-related classes --- :mod:`prolif.residue`
 
 import re
 from collections import UserDict
+from functools import lru_cache
 from typing import List, Optional
 
 import numpy as np
@@ -15,6 +16,16 @@ from prolif.rdkitmol import BaseRDKitMol
 _RE_RESID = re.compile(r"(TIP3|[A-Z0-9]?[A-Z]{2,3})?(\d*)\.?(\w)?")
 
 
+@lru_cache(maxsize=None)
+def _parse_resid_string(resid_str):
+    """Parses a residue string into a ``(name, number, chain)`` tuple. The same
+    strings are typically parsed over and over when indexing fingerprint
+    results so the output is cached."""
+    matches = _RE_RESID.search(resid_str)
+    name, number, chain = matches.groups()
+    return name, int(number) if number else 0, chain
+
+
 class ResidueId:
     """A unique residue identifier
 
@@ -28,10 +39,15 @@ class ResidueId:
         1-letter protein chain
     """
 
+    __slots__ = ("name", "number", "chain", "_hash")
+
     def __init__(self, name: str = "UNK", number: int = 0, chain: Optional[str] = None):
         self.name = name or "UNK"
         self.number = number or 0
         self.chain = chain or None
+        # residue ids are mostly used as dictionary keys and are hashed over
+        # and over when indexing results, so the hash is computed only once
+        self._hash = hash((self.name, self.number, self.chain))
 
     def __repr__(self):
         return f"ResidueId({self.name}, {self.number}, {self.chain})"
@@ -43,7 +59,7 @@ class ResidueId:
         return resid
 
     def __hash__(self):
-        return hash((self.name, self.number, self.chain))
+        return self._hash
 
     def __eq__(self, other):
         return hash(self) == hash(other)
@@ -68,6 +84,25 @@ class ResidueId:
             return cls(name, number, chain)
         return cls()
 
+    @classmethod
+    def from_mda(cls, residue):
+        """Creates a ResidueId from an MDAnalysis residue
+
+        Parameters
+        ----------
+        residue : MDAnalysis.core.groups.Residue
+            An MDAnalysis residue. The chain is read from the ``chainIDs``
+            atom attribute if present, mirroring what the RDKitConverter
+            stores in the :class:`~rdkit.Chem.rdchem.AtomMonomerInfo`
+
+        .. versionadded:: 2.1.0
+        """
+        name = getattr(residue, "resname", None)
+        number = int(getattr(residue, "resid", 0))
+        atoms = residue.atoms
+        chain = atoms.chainIDs[0] if hasattr(atoms, "chainIDs") else None
+        return cls(name, number, chain)
+
     @classmethod
     def from_string(cls, resid_str):
         """Creates a ResidueId from a string
@@ -103,10 +138,7 @@ class ResidueId:
         +-----------+----------------------------------+
 
         """
-        matches = _RE_RESID.search(resid_str)
-        name, number, chain = matches.groups()
-        number = int(number) if number else 0
-        return cls(name, number, chain)
+        return cls(*_parse_resid_string(resid_str))
 
 
 class Residue(BaseRDKitMol):
@@ -4,9 +4,7 @@ Helper functions --- :mod:`prolif.utils`
 """
 
 import warnings
-from collections import defaultdict
 from contextlib import contextmanager
-from copy import deepcopy
 from functools import wraps
 from importlib.util import find_spec
 from math import pi
@@ -108,7 +106,7 @@ def angle_between_limits(angle, min_angle, max_angle, ring=False):
     return min_angle <= angle <= max_angle
 
 
-def get_residues_near_ligand(lig, prot, cutoff=6.0):
+def get_residues_near_ligand(lig, prot, cutoff=6.0, tree=None):
     """Detects residues close to a reference ligand
 
     Parameters
@@ -120,18 +118,30 @@ def get_residues_near_ligand(lig, prot, cutoff=6.0):
     cutoff : float
         If any interatomic distance between the ligand reference points and a
         residue is below or equal to this cutoff, the residue will be selected
+    tree : scipy.spatial.cKDTree, optional
+        KD-tree built from the protein coordinates (``cKDTree(prot.xyz)``).
+        If ``None``, it is built on the fly. Passing a prebuilt tree avoids
+        reconstructing it for each ligand residue.
 
     Returns
     -------
     residues : list
         A list of unique :class:`~prolif.residue.ResidueId` that are close to
         the ligand
+
+    .. versionchanged:: 2.1.0
+        Added the ``tree`` parameter.
     """
-    tree = cKDTree(prot.xyz)
-    ix = tree.query_ball_point(lig.xyz, cutoff)
-    ix = set([i for lst in ix for i in lst])
-    resids = [ResidueId.from_atom(prot.GetAtomWithIdx(i)) for i in ix]
-    return list(set(resids))
+    if tree is None:
+        tree = cKDTree(prot.xyz)
+    lig_tree = cKDTree(lig.xyz)
+    ix = lig_tree.query_ball_tree(tree, cutoff)
+    ix = list({i for lst in ix for i in lst})
+    if not ix:
+        return []
+    residues = prot.residues
+    positions = np.unique(prot._atom_to_residue[ix])
+    return [residues[int(position)].resid for position in positions]
 
 
 def split_mol_by_residues(mol):
@@ -240,51 +250,14 @@ def to_dataframe(
         Removed the ``return_atoms`` parameter. Added the ``count`` parameter. Removed
         support for ``ifp`` containing ``np.ndarray`` bitvectors.
     """
-    ifp = deepcopy(ifp)
-    n_interactions = len(interactions)
     if dtype is None:
         dtype = np.uint8 if count else bool
     empty_value = dtype(0)
-    # create empty array for each residue pair interaction that doesn't exist
-    # in a particular frame
-    empty_arr = np.array([empty_value for _ in range(n_interactions)], dtype=dtype)
-    # residue pairs
-    residue_pairs = sorted(
-        set(
-            [residue_tuple for frame_ifp in ifp.values() for residue_tuple in frame_ifp]
-        )
-    )
-    # sparse to dense
-    data = defaultdict(list)
-    index = []
-    for i, frame_ifp in ifp.items():
-        index.append(i)
-        for residue_tuple in residue_pairs:
-            try:
-                ifp_dict = frame_ifp[residue_tuple]
-            except KeyError:
-                data[residue_tuple].append(empty_arr[:])
-            else:
-                if count:
-                    bitvector = np.array(
-                        [len(ifp_dict.get(i, ())) for i in interactions], dtype=dtype
-                    )
-                else:
-                    bitvector = np.array(
-                        [i in ifp_dict for i in interactions], dtype=bool
-                    )
-                data[residue_tuple].append(bitvector)
-    index = pd.Series(index, name=index_col)
-    # create dataframe
-    if not data:
+    index = pd.Series(list(ifp.keys()), name=index_col)
+    values, residue_pairs = _ifp_to_matrix(ifp, interactions, count=count, dtype=dtype)
+    if not residue_pairs:
         warnings.warn("No interaction detected")
         return pd.DataFrame([], index=index)
-    values = np.array(
-        [
-            np.hstack([bitvector_list[frame] for bitvector_list in data.values()])
-            for frame in range(len(index))
-        ]
-    )
     columns = pd.MultiIndex.from_tuples(
         [
             (str(lig_res), str(prot_res), i)
@@ -293,17 +266,61 @@ def to_dataframe(
         ],
         names=["ligand", "protein", "interaction"],
     )
-    df = pd.DataFrame(values, columns=columns, index=index)
-    df = df.astype(dtype)
     if drop_empty:
-        mask = (df != empty_value).any(axis=0)
-        df = df.loc[:, mask]
-    return df
+        # vectorized reduction over frames on the raw array, before paying for
+        # the dataframe construction
+        mask = (values != empty_value).any(axis=0)
+        values = values[:, mask]
+        columns = columns[mask]
+    return pd.DataFrame(values, columns=columns, index=index, copy=False)
+
+
+def _ifp_to_matrix(ifp, interactions, count=False, dtype=None):
+    """Converts IFPs to a dense matrix of interaction values, with one row per
+    frame and one column per residue pair and interaction combination, the
+    pairs being sorted. Shared by the dataframe and bitvector conversions.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        The dense matrix of interaction values.
+    residue_pairs : list
+        The sorted residue pairs corresponding to the column blocks.
+    """
+    if dtype is None:
+        dtype = np.uint8 if count else bool
+    n_interactions = len(interactions)
+    # residue pairs appearing in at least one frame
+    residue_pairs = sorted(
+        set(
+            [residue_tuple for frame_ifp in ifp.values() for residue_tuple in frame_ifp]
+        )
+    )
+    # sparse to dense: fill a preallocated array through precomputed column
+    # offsets instead of stacking one small array per residue pair and frame
+    pair_offsets = {
+        residue_tuple: n_interactions * i
+        for i, residue_tuple in enumerate(residue_pairs)
+    }
+    interaction_offsets = {name: i for i, name in enumerate(interactions)}
+    # the matrix is allocated directly with the requested dtype so that the
+    # dataframe can wrap it without any conversion or copy
+    values = np.zeros((len(ifp), n_interactions * len(residue_pairs)), dtype=dtype)
+    for row, frame_ifp in enumerate(ifp.values()):
+        for residue_tuple, ifp_dict in frame_ifp.items():
+            offset = pair_offsets[residue_tuple]
+            for name, metadata_tuple in ifp_dict.items():
+                try:
+                    column = offset + interaction_offsets[name]
+                except KeyError:
+                    continue
+                values[row, column] = len(metadata_tuple) if count else True
+    return values, residue_pairs
 
 
 def pandas_series_to_bv(s):
     bv = ExplicitBitVect(len(s))
-    on_bits = np.where(s >= True)[0].tolist()
+    on_bits = np.flatnonzero(s).tolist()
     bv.SetBitsFromList(on_bits)
     return bv
 
@@ -333,14 +350,66 @@ def to_bitvectors(df):
         0.42
 
     """
-    return df.apply(pandas_series_to_bv, axis=1).tolist()
+    return _matrix_to_bitvectors(df.to_numpy())
+
+
+def _matrix_to_bitvectors(values):
+    """Converts a dense matrix of interaction values to a list of RDKit
+    ExplicitBitVect, one per row"""
+    n_bits = values.shape[1]
+    bvs = []
+    for row in values:
+        bv = ExplicitBitVect(n_bits)
+        bv.SetBitsFromList(np.flatnonzero(row).tolist())
+        bvs.append(bv)
+    return bvs
+
+
+def tanimoto_similarity_matrix(df):
+    """Pairwise Tanimoto similarity between all frames of an interaction
+    DataFrame
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A DataFrame where each column corresponds to an interaction between two
+        residues, as obtained from :func:`~prolif.utils.to_dataframe`
+
+    Returns
+    -------
+    similarity : pandas.DataFrame
+        A square DataFrame of Tanimoto similarities, indexed by frame on both
+        axes
+
+    Notes
+    -----
+    Equivalent to calling :func:`~rdkit.DataStructs.TanimotoSimilarity` on
+    every pair of bitvectors from :func:`~prolif.utils.to_bitvectors`, but
+    computed in a single vectorized pass: the pairwise intersection counts are
+    obtained with a matrix product and the union counts derived from the
+    per-frame popcounts, without materializing RDKit bitvector objects.
+
+    .. versionadded:: 2.1.0
+    """
+    values = df.to_numpy(dtype=bool)
+    on_bits = values.sum(axis=1)
+    intersections = values.astype(np.uint32) @ values.T.astype(np.uint32)
+    unions = on_bits[:, None] + on_bits[None, :] - intersections
+    # same convention as RDKit: two empty bitvectors have a similarity of 0
+    similarity = np.divide(
+        intersections,
+        unions,
+        out=np.zeros(intersections.shape),
+        where=unions != 0,
+    )
+    return pd.DataFrame(similarity, index=df.index, columns=df.index, copy=False)
 
 
 def pandas_series_to_countvector(s):
     size = len(s)
     cv = UIntSparseIntVect(size)
-    for i in range(size):
-        cv[i] = int(s[i])
+    for i in np.flatnonzero(s):
+        cv[int(i)] = int(s[i])
     return cv
 
 
@@ -359,4 +428,18 @@ def to_countvectors(df):
         A list of :class:`~rdkit.DataStructs.cDataStructs.UIntSparseIntVect`
         for each frame
     """
-    return df.apply(pandas_series_to_countvector, axis=1).tolist()
+    return _matrix_to_countvectors(df.to_numpy())
+
+
+def _matrix_to_countvectors(values):
+    """Converts a dense matrix of interaction counts to a list of RDKit
+    UIntSparseIntVect, one per row"""
+    size = values.shape[1]
+    cvs = []
+    for row in values:
+        cv = UIntSparseIntVect(size)
+        # the sparse vector defaults to 0 so only nonzero counts need to be set
+        for i in np.flatnonzero(row):
+            cv[int(i)] = int(row[i])
+        cvs.append(cv)
+    return cvs
@@ -261,6 +261,18 @@ class TestFingerprint:
         multi = fp.to_dataframe()
         assert serial.equals(multi)
 
+    def test_run_multiproc_sees_fingerprint_changes(self, u, ligand_ag, protein_ag):
+        fp = Fingerprint(["Hydrophobic"])
+        fp.run(u.trajectory[0:100:10], ligand_ag, protein_ag, n_jobs=2, progress=False)
+        # the next parallel run would reuse the pool: changes made to the
+        # fingerprint in between runs must still be taken into account
+        fp.hydrophobic.distance = 1.0
+        fp.run(u.trajectory[0:100:10], ligand_ag, protein_ag, n_jobs=2, progress=False)
+        multi = fp.to_dataframe()
+        fp.run(u.trajectory[0:100:10], ligand_ag, protein_ag, n_jobs=1, progress=False)
+        serial = fp.to_dataframe()
+        assert serial.equals(multi)
+
     def test_run_iter_multiproc_serial_same(self, fp, protein_mol):
         run = fp.run_from_iterable
         path = str(datapath / "vina" / "vina_output.sdf")
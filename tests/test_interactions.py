@@ -7,7 +7,8 @@ from rdkit import Chem, RDLogger
 import prolif
 from prolif.fingerprint import Fingerprint
 from prolif.interactions import VdWContact
-from prolif.interactions.base import _INTERACTIONS, Interaction, get_mapindex
+from prolif.interactions.base import _INTERACTIONS, Interaction
+from prolif.interactions.utils import get_mapindex
 
 # disable rdkit warnings
 lg = RDLogger.logger()
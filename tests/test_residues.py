@@ -105,6 +105,10 @@ class TestResidueId:
         resid = ResidueId.from_string(resid_str)
         assert resid == ResidueId(*expected)
 
+    def test_from_mda(self, protein_ag, protein_mol):
+        residues = {ResidueId.from_mda(residue) for residue in protein_ag.residues}
+        assert residues == set(protein_mol.residues)
+
     def test_eq(self):
         name, number, chain = "ALA", 1, "A"
         res1 = ResidueId(name, number, chain)
@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_equal
 from rdkit import Chem
+from rdkit.DataStructs import TanimotoSimilarity
 
 from prolif.residue import Residue, ResidueGroup, ResidueId
 from prolif.utils import (
@@ -14,6 +15,7 @@ from prolif.utils import (
     is_peptide_bond,
     pandas_series_to_bv,
     split_mol_by_residues,
+    tanimoto_similarity_matrix,
     to_bitvectors,
     to_dataframe,
 )
@@ -254,3 +256,13 @@ def test_to_bv(ifp):
     bvs = to_bitvectors(df)
     assert len(bvs) == 2
     assert bvs[0].GetNumOnBits() == 2
+
+
+def test_tanimoto_similarity_matrix(ifp):
+    df = to_dataframe(ifp, ["A", "B", "C"])
+    bvs = to_bitvectors(df)
+    sim = tanimoto_similarity_matrix(df)
+    assert sim.shape == (2, 2)
+    for i in range(2):
+        for j in range(2):
+            assert sim.iloc[i, j] == pytest.approx(TanimotoSimilarity(bvs[i], bvs[j]))